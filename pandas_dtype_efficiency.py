@@ -3,18 +3,404 @@ Evaluating pandas DataFrames to see whether the data can be compressed in a loss
 """
 
 # Standard libraries
-from typing import Dict, List, Union
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import Dict, List, Optional, Tuple, Union
+import warnings
 
 # Third party libraries
 import numpy as np
 import pandas as pd
 
+# Optional third party libraries
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pq = None
+
+# Arrow-backed pandas arrays, which are only available in more recent versions of pandas
+_ARROW_ARRAY_TYPES = (getattr(pd.arrays, 'ArrowExtensionArray'),) if hasattr(pd.arrays, 'ArrowExtensionArray') else ()
+
+# Arrow string storage can be suggested for string columns when both pyarrow and a recent enough pandas are installed
+_ARROW_STRINGS_AVAILABLE = pa is not None and bool(_ARROW_ARRAY_TYPES)
+_ARROW_STRING_DTYPE = 'string[pyarrow]'
+
+# Arrow can only cast columns to half-precision floats from pyarrow 16, so earlier versions write them to parquet files
+# as single-precision floats instead
+_ARROW_HALF_FLOATS_AVAILABLE = pa is not None and int(pa.__version__.split('.')[0]) >= 16
+
+
+# Integer types which columns can be reduced to, ordered from smallest to largest
+_INTEGER_TYPES = [np.int8, np.int16, np.int32]
+
+# Number of bits used by each of the integer types, in ascending order
+_INTEGER_BITS = np.array([np.iinfo(int_type).bits for int_type in _INTEGER_TYPES])
+
+# Number of rows sampled, as a multiple of the categorical threshold, to check for distinct values before a whole string
+# column is factorised
+_CARDINALITY_SAMPLE_MULTIPLIER = 100
+
+# Number of values reduced at a time when finding the range of a column, small enough for a chunk to stay in cache
+_REDUCTION_CHUNK_SIZE = 65_536
+
+# Minimum number of rows for which numeric columns are reduced in parallel threads
+_PARALLEL_REDUCTION_MIN_ROWS = 100_000
+
+# Number of leading rows used to estimate the memory taken up by the Python objects in a column
+_MEMORY_SAMPLE_SIZE = 1_000
+
+# Largest share of a DataFrame's columns which are cast by assigning them into a copy of it, rather than by assembling
+# a new DataFrame; beyond this the replaced columns leave the copy fragmented into many blocks
+_SPARSE_CAST_MAX_COLUMN_RATIO = 0.1
+
+# Float types which columns can be reduced to, ordered from smallest to largest
+_FLOAT_TYPES = [np.float16, np.float32]
+
+
+def _is_low_cardinality(values: np.ndarray, max_distinct_values: int) -> bool:
+    """
+    Check whether an array contains no more than a given number of distinct (non-missing) values, stopping as soon as
+    the limit is exceeded rather than hashing every element.
+
+    Parameters
+    ----------
+    values : numpy array
+        Values to be checked.
+    max_distinct_values : int
+        The maximum number of distinct values permitted.
+
+    Returns
+    -------
+    bool
+        True if the number of distinct non-missing values does not exceed `max_distinct_values`.
+    """
+
+    distinct_values = set()
+    missing_values = set()
+
+    for value in values:
+        if value in distinct_values or value in missing_values:
+            continue
+
+        # Missing values are ignored, consistent with pandas.Series.nunique
+        if pd.isna(value):
+            missing_values.add(value)
+            continue
+
+        distinct_values.add(value)
+
+        if len(distinct_values) > max_distinct_values:
+            return False
+
+    return True
+
+
+def _build_lower_memory_parquet_schema(
+        schema: 'pa.Schema', column_ranges: Dict[str, Tuple[float, float]], distinct_strings: Dict[str, Optional[set]],
+        float_size: int
+) -> Tuple[Dict[str, Union[type, str]], 'pa.Schema']:
+    """
+    Find the lower-memory data type of each column in a parquet file from the statistics gathered across its batches,
+    along with the schema for writing the file in these types.
+
+    Parameters
+    ----------
+    schema : pyarrow Schema
+        Schema of the parquet file.
+    column_ranges : dict
+        Minimum and maximum value of each numeric column which could be reduced.
+    distinct_strings : dict
+        Distinct values of each string column, or None for columns with too many distinct values to be categorical.
+    float_size : int
+        The desired numpy float type; 16: numpy float16, 32: numpy float32, 64: numpy float64 (the pandas default).
+
+    Returns
+    -------
+    tuple
+        Any columns with the potential for reduced memory and the dtype that can be used to represent them once read
+        into pandas, and the schema with the lower-memory types applied.
+    """
+
+    possible_improvements = {}
+    output_schema = schema
+
+    for position, field in enumerate(schema):
+        if field.name in column_ranges:
+            min_val, max_val = column_ranges[field.name]
+            itemsize = np.dtype(field.type.to_pandas_dtype()).itemsize
+
+            if pa.types.is_integer(field.type):
+                min_vals, max_vals = np.array([[min_val], [max_val]], dtype=np.float64)
+                new_dtype = _find_smaller_integer_types(min_vals=min_vals, max_vals=max_vals, itemsizes=[itemsize])[0]
+            else:
+                new_dtype = _find_smaller_float_type(
+                    min_val=min_val, max_val=max_val, float_size=float_size, itemsize=itemsize
+                )
+
+            if new_dtype is None:
+                continue
+
+            possible_improvements[field.name] = new_dtype
+            new_type = pa.from_numpy_dtype(
+                np.float32 if new_dtype is np.float16 and not _ARROW_HALF_FLOATS_AVAILABLE else new_dtype
+            )
+
+        elif field.name in distinct_strings:
+            # Strings with too many distinct values to be categorical are already stored as Arrow strings in the file,
+            # so are only suggested as Arrow strings for reading into pandas
+            if distinct_strings[field.name] is None:
+                if _ARROW_STRINGS_AVAILABLE:
+                    possible_improvements[field.name] = _ARROW_STRING_DTYPE
+                continue
+
+            possible_improvements[field.name] = 'category'
+            new_type = pa.dictionary(pa.int32(), field.type)
+
+        else:
+            continue
+
+        output_schema = output_schema.set(position, field.with_type(new_type))
+
+    return possible_improvements, output_schema
+
+
+def _cast_record_batch(batch: 'pa.RecordBatch', schema: 'pa.Schema') -> 'pa.Table':
+    """
+    Cast a batch of rows read from a parquet file to a schema of lower-memory types. Columns are dictionary encoded
+    directly rather than cast to a dictionary type, which older versions of pyarrow do not support.
+
+    Parameters
+    ----------
+    batch : pyarrow RecordBatch
+        Rows to be cast.
+    schema : pyarrow Schema
+        Schema with the same fields as the batch, in the same order, but with lower-memory types.
+
+    Returns
+    -------
+    pyarrow Table
+        Rows represented in the lower-memory types.
+    """
+
+    columns = [
+        column.dictionary_encode()
+        if pa.types.is_dictionary(field.type) and not pa.types.is_dictionary(column.type)
+        else column.cast(field.type)
+        for column, field in zip(batch.columns, schema)
+    ]
+
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _copy_on_write_enabled() -> bool:
+    """
+    Check whether pandas copies data shared between DataFrames once either of them is edited, so that a new DataFrame
+    can share data with the original without edits to one showing up in the other.
+
+    Returns
+    -------
+    bool
+        True from pandas 3, or in earlier versions if the copy-on-write option has been enabled.
+    """
+
+    return int(pd.__version__.split('.')[0]) >= 3 or getattr(pd.options.mode, 'copy_on_write', False) is True
+
+
+def _estimate_memory_usage(column: pd.Series) -> int:
+    """
+    Estimate the number of bytes taken up by a column's values. Columns of Python objects, such as strings, are
+    estimated from a sample of their leading rows rather than measuring every object.
+
+    Parameters
+    ----------
+    column : pandas Series
+        Column to be measured.
+
+    Returns
+    -------
+    int
+        Estimated memory usage in bytes.
+    """
+
+    if pd.api.types.is_string_dtype(column.dtype) and len(column) > _MEMORY_SAMPLE_SIZE:
+        sample = column.iloc[:_MEMORY_SAMPLE_SIZE]
+        return int(sample.memory_usage(index=False, deep=True) / len(sample) * len(column))
+
+    return column.memory_usage(index=False, deep=True)
+
+
+def _find_smaller_float_type(min_val: float, max_val: float, float_size: int, itemsize: int) -> Optional[type]:
+    """
+    Find the float type of the desired precision which can accommodate a range of values, moving up to the next largest
+    float type if the values would otherwise overflow to infinity.
+
+    Parameters
+    ----------
+    min_val : float
+        Minimum of the values.
+    max_val : float
+        Maximum of the values.
+    float_size : int
+        The desired numpy float type; 16: numpy float16, 32: numpy float32.
+    itemsize : int
+        Number of bytes taken up by each value in the type currently used.
+
+    Returns
+    -------
+    type or None
+        Float type which can accommodate the values, or None if there is no such type smaller than the current one.
+    """
+
+    for float_type in _FLOAT_TYPES:
+        if np.finfo(float_type).bits < float_size:
+            continue
+
+        # Only suggest a type if it is smaller than the one already in use
+        if np.dtype(float_type).itemsize >= itemsize:
+            return None
+
+        # Bounds are compared as Python floats so that the values are never cast down to the smaller type themselves
+        if min_val >= float(np.finfo(float_type).min) and max_val <= float(np.finfo(float_type).max):
+            return float_type
+
+    return None
+
+
+def _find_smaller_integer_types(
+        min_vals: np.ndarray, max_vals: np.ndarray, itemsizes: List[int]
+) -> List[Optional[type]]:
+    """
+    Find the smallest integer type which can accommodate each range of values.
+
+    Parameters
+    ----------
+    min_vals : numpy array
+        Minimum of each range of values.
+    max_vals : numpy array
+        Maximum of each range of values.
+    itemsizes : list
+        Number of bytes taken up by each value in the type currently used for each range.
+
+    Returns
+    -------
+    list
+        Integer type which can accommodate each range of values, or None if there is no such type smaller than the
+        current one.
+    """
+
+    # A signed integer v needs the bit length of v (or of -v - 1 when negative) plus a sign bit. The exponent from
+    # frexp is that bit length, and is exact for every bound of the smaller integer types
+    largest_magnitudes = np.maximum(max_vals, -min_vals - 1)
+    bits_required = np.frexp(largest_magnitudes)[1] + 1
+
+    # Position of the smallest integer type which can accommodate each range; len(_INTEGER_TYPES) if none can
+    smallest_types = np.searchsorted(_INTEGER_BITS, bits_required, side='left')
+
+    # Only suggest a type if it is smaller than the one already in use
+    return [
+        _INTEGER_TYPES[type_position]
+        if type_position < len(_INTEGER_TYPES) and np.dtype(_INTEGER_TYPES[type_position]).itemsize < itemsize
+        else None
+        for type_position, itemsize in zip(smallest_types, itemsizes)
+    ]
+
+
+def _get_min_max(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Find the minimum and maximum of a numeric array, ignoring missing values. The array is reduced one cache-sized chunk
+    at a time, so that finding the maximum of each chunk reads it from cache rather than from main memory a second
+    time.
+
+    Parameters
+    ----------
+    values : numpy array
+        Numeric values to be reduced.
+
+    Returns
+    -------
+    tuple
+        Minimum and maximum value, or infinity and minus infinity respectively if the array only contains missing
+        values.
+    """
+
+    # fmin and fmax ignore NaN, whilst min and max are faster for integers which cannot be missing
+    if values.dtype.kind == 'f':
+        reduce_min, reduce_max = np.fmin.reduce, np.fmax.reduce
+    else:
+        reduce_min, reduce_max = np.minimum.reduce, np.maximum.reduce
+
+    min_val, max_val = np.inf, -np.inf
+
+    for start in range(0, len(values), _REDUCTION_CHUNK_SIZE):
+        chunk = values[start:start + _REDUCTION_CHUNK_SIZE]
+
+        # An all-missing chunk reduces to NaN, which never compares as smaller or larger so leaves the range unchanged
+        min_val = min(min_val, reduce_min(chunk))
+        max_val = max(max_val, reduce_max(chunk))
+
+    return min_val, max_val
+
+
+def _update_parquet_column_statistics(
+        batch: 'pa.RecordBatch', column_ranges: Dict[str, Tuple[float, float]],
+        distinct_strings: Dict[str, Optional[set]], threshold: int
+) -> None:
+    """
+    Fold a batch of rows read from a parquet file into the running statistics of each column, discarding columns as
+    soon as they are found to be unable to reduce their memory usage.
+
+    Parameters
+    ----------
+    batch : pyarrow RecordBatch
+        Rows of the columns being checked.
+    column_ranges : dict
+        Running range of each numeric column, which is updated in place.
+    distinct_strings : dict
+        Distinct values of each string column, which are updated in place and replaced by None once there are more
+        than the categorical threshold.
+    threshold : int
+        The maximum number of distinct values in a column of strings to suggest transforming it into a categorical
+        column.
+    """
+
+    for col in list(column_ranges):
+        values = batch.column(col)
+
+        # Integer columns with missing values are read into pandas as floats, so cannot be reduced
+        if pa.types.is_integer(values.type) and values.null_count:
+            del column_ranges[col]
+            continue
+
+        # Batches of only missing values reduce to null or NaN, which leave the range unchanged
+        batch_range = pc.min_max(values)
+
+        if batch_range['min'].is_valid:
+            min_val, max_val = column_ranges[col]
+            column_ranges[col] = (min(min_val, batch_range['min'].as_py()), max(max_val, batch_range['max'].as_py()))
+
+    for col, strings in distinct_strings.items():
+        if strings is not None:
+            strings.update(pc.unique(batch.column(col)).drop_null().to_pylist())
+
+            if len(strings) > threshold:
+                distinct_strings[col] = None
+
 
 class DataFrameChecker:
     """
     Evaluate a pandas DataFrame to see whether its memory usage can be reduced whilst still preserving its data.
     """
 
+    # Fixed set of attributes, so instances do not each carry a __dict__
+    __slots__ = (
+        '_all_possible_improvements', '_dataframe_has_been_analysed', '_df', '_categorical_threshold', '_column_cache',
+        '_columns_by_type', '_float_size'
+    )
+
     def __init__(self, df: pd.DataFrame, categorical_threshold: int = 15, float_size: int = 16):
         """
         Initialise checker with the DataFrame that needs to be evaluated.
@@ -34,44 +420,212 @@ class DataFrameChecker:
         self._dataframe_has_been_analysed = False
         self._df = df
         self._categorical_threshold = categorical_threshold
+        # Per-column results which are worked out once whilst analysing the DataFrame; prebuilt categoricals, numbers
+        # of distinct strings, ranges of numeric columns and numpy arrays of column values
+        self._column_cache = {'categoricals': {}, 'distinct_counts': {}, 'ranges': {}, 'values': {}}
         self._columns_by_type = self._separate_dtypes()
 
         if float_size not in [16, 32, 64]:
             raise ValueError('float_size must correspond to a numpy.float (one of 16, 32, or 64)')
         self._float_size = float_size
 
-    def cast_dataframe_to_lower_memory_version(self) -> Union[pd.DataFrame, None]:
+    @classmethod
+    def analyse_parquet(
+            cls, path: str, categorical_threshold: int = 15, float_size: int = 16, output_path: Optional[str] = None
+    ) -> Dict[str, Union[type, str]]:
+        """
+        Evaluate a parquet file one batch of rows at a time, so that datasets which do not fit in memory can still be
+        checked for columns that could reduce their memory usage. Optionally, write a copy of the file with these
+        columns cast to their lower-memory data types, again one batch at a time.
+
+        Parameters
+        ----------
+        path : str
+            Location of the parquet file to be checked.
+        categorical_threshold : int (default 15)
+            The maximum number of distinct values in a column of strings to suggest transforming it into a categorical
+            column.
+        float_size : int (default 16)
+            The desired numpy float type; 16: numpy float16, 32: numpy float32, 64: numpy float64 (the pandas default).
+        output_path : str (optional)
+            Location to write a copy of the parquet file with the lower-memory data types applied. Versions of pyarrow
+            before 16 cannot write numpy float16 columns, so these are written as numpy float32 instead.
+
+        Returns
+        -------
+        dict
+            Any columns with the potential for reduced memory, and the dtype that can be used to represent them in a
+            more efficient manner once read into pandas. As with a DataFrame of Python strings, string columns with
+            too many distinct values to be categorical are suggested as Arrow strings.
+        """
+
+        if pq is None:
+            raise ImportError('pyarrow must be installed to analyse parquet files')
+
+        if float_size not in [16, 32, 64]:
+            raise ValueError('float_size must correspond to a numpy.float (one of 16, 32, or 64)')
+
+        parquet_file = pq.ParquetFile(path)
+        schema = parquet_file.schema_arrow
+
+        # Running range of each numeric column, and the distinct values of each string column until they exceed the
+        # categorical threshold
+        column_ranges = {}
+        distinct_strings = {}
+
+        # Index columns written by pandas are read back in as the index rather than as columns, so are not checked
+        index_columns = {col for col in (schema.pandas_metadata or {}).get('index_columns', []) if isinstance(col, str)}
+
+        for field in (field for field in schema if field.name not in index_columns):
+            if pa.types.is_integer(field.type) or (pa.types.is_floating(field.type) and float_size != 64):
+                column_ranges[field.name] = (np.inf, -np.inf)
+            elif pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+                distinct_strings[field.name] = set()
+
+        for batch in parquet_file.iter_batches(columns=[*column_ranges, *distinct_strings]):
+            _update_parquet_column_statistics(
+                batch=batch, column_ranges=column_ranges, distinct_strings=distinct_strings,
+                threshold=categorical_threshold
+            )
+
+        possible_improvements, output_schema = _build_lower_memory_parquet_schema(
+            schema=schema, column_ranges=column_ranges, distinct_strings=distinct_strings, float_size=float_size
+        )
+
+        if output_path is not None:
+            with pq.ParquetWriter(output_path, output_schema) as writer:
+                for batch in parquet_file.iter_batches():
+                    writer.write_table(_cast_record_batch(batch=batch, schema=output_schema))
+
+        return possible_improvements
+
+    def cast_dataframe_to_lower_memory_version(self, reuse_categoricals: bool = False) -> Union[pd.DataFrame, None]:
         """
         Take the original DataFrame and create a new one in which the appropriate columns have been cast to a
         lower-memory data type.
 
+        Parameters
+        ----------
+        reuse_categoricals : bool (default False)
+            Reuse the categoricals built whilst analysing the string columns rather than converting them again, so that
+            every string is only hashed once. Only use this if the DataFrame has not been edited since it was analysed,
+            otherwise the edits are lost from the categorical columns.
+
         Returns
         -------
-        pandas DataFrame
-            Original data represented in lower-memory data types where possible.
+        pandas DataFrame or None
+            Original data represented in lower-memory data types where possible, or None (with a warning) if the
+            DataFrame has not been analysed yet or no possible improvements were found.
         """
 
         if not self._dataframe_has_been_analysed:
-            raise UserWarning(
+            warnings.warn(
                 'DataFrame has not been analysed for improvements yet. Run `identify_possible_improvements` method '
-                'first.'
+                'first.',
+                UserWarning
             )
+            return None
 
         if not self._all_possible_improvements:
-            raise UserWarning('No possible improvements have been found after analysing DataFrame.')
+            warnings.warn('No possible improvements have been found after analysing DataFrame.', UserWarning)
+            return None
 
-        lower_memory_df = self._df.astype(dtype=self._all_possible_improvements)
+        lower_memory_df = self._build_lower_memory_dataframe(reuse_categoricals=reuse_categoricals)
 
-        original_df_memory_size_bytes = self._df.memory_usage(deep=True).sum()
-        new_df_memory_size_bytes = lower_memory_df.memory_usage(deep=True).sum()
+        # The index is shared by both DataFrames, so is only measured once but is still counted in each total
+        index_size_bytes = self._df.index.memory_usage(deep=True)
+        original_sizes_bytes = [_estimate_memory_usage(column=column) for _, column in self._df.items()]
 
-        print(f'Original DataFrame memory: {(original_df_memory_size_bytes / 1024):,.2f} megabytes')
-        print(f'New DataFrame memory: {(new_df_memory_size_bytes / 1024):,.2f} megabytes')
+        # Only the cast columns need measuring again, and these all have cheaply measured lower-memory types
+        new_sizes_bytes = [
+            _estimate_memory_usage(column=new_column) if col in self._all_possible_improvements else original_size
+            for (col, new_column), original_size in zip(lower_memory_df.items(), original_sizes_bytes)
+        ]
+
+        print(f'Original DataFrame memory: {sum(original_sizes_bytes, index_size_bytes) / 1024 ** 2:,.2f} megabytes')
+        print(f'New DataFrame memory: {sum(new_sizes_bytes, index_size_bytes) / 1024 ** 2:,.2f} megabytes')
         return lower_memory_df
 
+    def _build_lower_memory_dataframe(self, reuse_categoricals: bool) -> pd.DataFrame:
+        """
+        Create a new DataFrame with the possible improvements applied, casting the columns straight from their
+        underlying arrays. Every other column shares the original data if pandas' copy-on-write is enabled, and is
+        copied otherwise so that edits to the new DataFrame cannot alter the original.
+
+        Parameters
+        ----------
+        reuse_categoricals : bool
+            Reuse the categoricals built whilst analysing the string columns rather than converting them again.
+
+        Returns
+        -------
+        pandas DataFrame
+            Original data with possible improvements applied.
+        """
+
+        # When only a few columns of a wide DataFrame change, replacing them in a copy avoids rebuilding the DataFrame
+        # column by column
+        if len(self._all_possible_improvements) < _SPARSE_CAST_MAX_COLUMN_RATIO * self._df.shape[1]:
+            lower_memory_df = self._df.copy(deep=not _copy_on_write_enabled())
+
+            for col, new_dtype in self._all_possible_improvements.items():
+                lower_memory_df[col] = self._cast_column(
+                    col=col, column=self._df[col], new_dtype=new_dtype, reuse_categoricals=reuse_categoricals
+                )
+
+            return lower_memory_df
+
+        new_columns = {}
+
+        for col, column in self._df.items():
+            new_dtype = self._all_possible_improvements.get(col)
+
+            if new_dtype is None:
+                new_columns[col] = column
+            else:
+                new_columns[col] = self._cast_column(
+                    col=col, column=column, new_dtype=new_dtype, reuse_categoricals=reuse_categoricals
+                )
+
+        # Columns are kept as Series sharing the original index so their dtypes are not inferred again, and are only
+        # copied when copy-on-write cannot stop edits to the new DataFrame from reaching the original
+        lower_memory_df = pd.DataFrame(data=new_columns, index=self._df.index, copy=not _copy_on_write_enabled())
+        lower_memory_df.columns = self._df.columns
+
+        return lower_memory_df
+
+    def _cast_column(self, col: str, column: pd.Series, new_dtype: str, reuse_categoricals: bool) -> pd.Series:
+        """
+        Cast a single column to its lower-memory data type.
+
+        Parameters
+        ----------
+        col : str
+            Name of the column.
+        column : pandas Series
+            Values of the column in the original DataFrame.
+        new_dtype : str
+            Lower-memory data type which the column should be cast to.
+        reuse_categoricals : bool
+            Reuse the categorical built whilst analysing the column, if it is cast to a categorical.
+
+        Returns
+        -------
+        pandas Series
+            Column cast to the new data type, sharing the original index.
+        """
+
+        if new_dtype == 'category' and reuse_categoricals:
+            return pd.Series(data=self._column_cache['categoricals'][col], index=self._df.index, copy=False)
+
+        if new_dtype in ('category', _ARROW_STRING_DTYPE):
+            return column.astype(new_dtype)
+
+        return pd.Series(data=column.to_numpy(copy=False).astype(new_dtype), index=self._df.index, copy=False)
+
     def _check_if_integer_sizes_can_be_reduced(self) -> Dict[str, type]:
         """
-        Evaluate each integer column and see whether it can be reduced from int64 to a smaller integer type.
+        Evaluate each integer column and see whether it can be reduced to a smaller integer type.
 
         Returns
         -------
@@ -79,20 +633,6 @@ class DataFrameChecker:
             Mapping between column name and a reduced integer size which can accommodate its values.
         """
 
-        # Range of values which different integer sizes can accommodate
-        integer_ranges = {
-            '8_min': -128, '8_max': 127,
-            '16_min': -32768, '16_max': 32767,
-            '32_min': -2147483648, '32_max': 2147483647
-        }
-
-        # Mapping between integer size and numpy type
-        integer_size_to_numpy_type = {
-            8: np.int8,
-            16: np.int16,
-            32: np.int32
-        }
-
         possible_improvements = {}
 
         int_columns = self._columns_by_type.get('int')
@@ -101,27 +641,34 @@ class DataFrameChecker:
         if not int_columns:
             return possible_improvements
 
-        # Check if column could be accommodated within a smaller integer size
-        for col in int_columns:
-            min_val = self._df[col].min()
-            max_val = self._df[col].max()
+        # Stop if there are no values to evaluate
+        if self._df.empty:
+            return possible_improvements
+
+        min_vals, max_vals = self._get_column_ranges(columns=int_columns)
 
-            for int_size in [8, 16, 32]:
-                if min_val >= integer_ranges[f'{int_size}_min'] and max_val <= integer_ranges[f'{int_size}_max']:
-                    possible_improvements[col] = integer_size_to_numpy_type[int_size]
-                    break
+        integer_types = _find_smaller_integer_types(
+            min_vals=min_vals,
+            max_vals=max_vals,
+            itemsizes=[self._get_column_values(col).dtype.itemsize for col in int_columns]
+        )
+
+        possible_improvements = {
+            col: integer_type for col, integer_type in zip(int_columns, integer_types) if integer_type is not None
+        }
 
         return possible_improvements
 
     def _check_if_strings_could_be_categorical(self) -> Dict[str, str]:
         """
         Evaluate each string column and see whether it contains a low number of distinct values, indicating it could
-        be represented as a categorical variable.
+        be represented as a categorical variable. If pyarrow is installed, columns of Python strings which cannot be
+        categorical are instead represented with Arrow's string storage.
 
         Returns
         -------
         dict
-            Any columns containing strings which could be transformed into a categorical variable.
+            Any columns containing strings which could be transformed into a categorical variable or Arrow strings.
         """
 
         possible_improvements = {}
@@ -132,15 +679,125 @@ class DataFrameChecker:
         if not string_columns:
             return possible_improvements
 
+        self._column_cache['categoricals'].clear()
+
+        sample_size = max(_CARDINALITY_SAMPLE_MULTIPLIER * self._categorical_threshold, 1)
+
         for col in string_columns:
-            if self._df[col].nunique() <= self._categorical_threshold:
-                possible_improvements[col] = 'category'
+            # Columns no longer than the sample are factorised straight away, as sampling them would read every value
+            # twice
+            if len(self._df) <= sample_size or self._sample_could_be_categorical(col=col, sample_size=sample_size):
+                categorical = self._factorise_if_low_cardinality(col)
+
+                if categorical is not None:
+                    self._column_cache['categoricals'][col] = categorical
+                    possible_improvements[col] = 'category'
+                    continue
+
+            # Python strings with too many distinct values to be categorical can still be stored more compactly by Arrow
+            if self._could_use_arrow_strings(col):
+                possible_improvements[col] = _ARROW_STRING_DTYPE
 
         return possible_improvements
 
+    def _sample_could_be_categorical(self, col: str, sample_size: int) -> bool:
+        """
+        Check whether a sample of rows spread evenly throughout a string column contains a low number of distinct
+        values, so that high-cardinality columns can be ruled out without hashing every value. Spreading the sample
+        ensures sorted or grouped data is still sampled fairly.
+
+        Parameters
+        ----------
+        col : str
+            Name of the string column.
+        sample_size : int
+            The maximum number of rows to sample.
+
+        Returns
+        -------
+        bool
+            True if the sampled values contain no more distinct values than the categorical threshold.
+        """
+
+        # The step between sampled rows is rounded up so that no more than the sample size is read
+        sampled_values = self._df[col].iloc[::-(-len(self._df) // sample_size)]
+
+        # Arrow-backed strings are counted by Arrow's hash kernel rather than converting each value to a Python object;
+        # pyarrow must be installed for such columns to exist
+        if isinstance(sampled_values.array, _ARROW_ARRAY_TYPES):
+            return pc.count_distinct(pa.array(sampled_values.array)).as_py() <= self._categorical_threshold
+
+        return _is_low_cardinality(values=sampled_values.to_numpy(), max_distinct_values=self._categorical_threshold)
+
+    def _could_use_arrow_strings(self, col: str) -> bool:
+        """
+        Check whether a column holds Python string objects which could be stored as Arrow strings instead, avoiding the
+        overhead of a separate Python object for every value.
+
+        Parameters
+        ----------
+        col : str
+            Name of the string column.
+
+        Returns
+        -------
+        bool
+            True if pyarrow is installed and the column only contains Python strings or missing values.
+        """
+
+        return (
+            _ARROW_STRINGS_AVAILABLE
+            and self._df[col].dtype == object
+            and pd.api.types.infer_dtype(self._get_column_values(col), skipna=True) == 'string'
+        )
+
+    def _factorise_if_low_cardinality(self, col: str) -> Optional[pd.Categorical]:
+        """
+        Factorise a string column into a categorical, provided it contains a low enough number of distinct values. The
+        categorical can be kept so the column does not need hashing again when the DataFrame is cast.
+
+        Parameters
+        ----------
+        col : str
+            Name of the string column.
+
+        Returns
+        -------
+        pandas Categorical or None
+            Column represented as a categorical, or None if it contains more distinct values than the categorical
+            threshold.
+        """
+
+        # A column already found to have too many distinct values, when reusing an earlier analysis, is not hashed again
+        distinct_count = self._column_cache['distinct_counts'].get(col)
+
+        if distinct_count is not None and distinct_count > self._categorical_threshold:
+            return None
+
+        # pandas factorises Arrow-backed columns with Arrow's dictionary encoding kernel. Only the number of distinct
+        # values is kept, rather than the codes which take up as much memory as the column itself
+        codes, categories = pd.factorize(self._df[col])
+        self._column_cache['distinct_counts'][col] = len(categories)
+
+        if len(categories) > self._categorical_threshold:
+            return None
+
+        # Only the few categories are sorted, in the same way as astype('category'), rather than every value. Missing
+        # values are coded as -1 so index the appended -1 and stay missing
+        category_positions, sorted_categories = pd.factorize(categories, sort=True)
+        codes = np.append(category_positions, -1)[codes]
+
+        # Python string categories have their dtype inferred again in the same way as astype('category'), which stores
+        # them in pandas' own string dtype from pandas 3. They are copied out, as copy-on-write would otherwise give a
+        # read-only array which some versions of pandas cannot measure the memory of
+        categories = pd.Index(np.array(sorted_categories)) if sorted_categories.dtype == object else sorted_categories
+
+        return pd.Categorical.from_codes(codes=codes, categories=categories)
+
     def _flag_float_column_improvements(self) -> Dict[str, type]:
         """
-        Map each float column and how it could be represented in a lower precision.
+        Map each float column and how it could be represented in a lower precision. If a column's values fall outside
+        the range of the desired precision, the next largest float type is used instead so that no values overflow.
 
         Returns
         -------
@@ -154,23 +811,102 @@ class DataFrameChecker:
         if self._float_size == 64:
             return possible_improvements
 
-        # Mapping between desired float size and numpy type
-        float_size_to_numpy_type = {
-            16: np.float16,
-            32: np.float32
-        }
-
         float_columns = self._columns_by_type.get('float')
 
         # Stop if no float columns exist
         if not float_columns:
             return possible_improvements
 
-        for col in float_columns:
-            possible_improvements[col] = float_size_to_numpy_type[self._float_size]
+        min_vals, max_vals = self._get_column_ranges(columns=float_columns)
+
+        for col, min_val, max_val in zip(float_columns, min_vals, max_vals):
+            float_type = _find_smaller_float_type(
+                min_val=min_val,
+                max_val=max_val,
+                float_size=self._float_size,
+                itemsize=self._get_column_values(col).dtype.itemsize
+            )
+
+            if float_type is not None:
+                possible_improvements[col] = float_type
 
         return possible_improvements
 
+    def _get_column_range(self, col: str) -> Tuple[float, float]:
+        """
+        Find the minimum and maximum value of a numeric column. Missing values are ignored, and a column of only missing
+        values has a range which any float type can accommodate. Ranges are cached so that an analysis which reuses an
+        earlier one does not reduce every column again.
+
+        Parameters
+        ----------
+        col : str
+            Name of the numeric column.
+
+        Returns
+        -------
+        tuple
+            Minimum and maximum value of the column.
+        """
+
+        column_ranges = self._column_cache['ranges']
+
+        if col not in column_ranges:
+            column_ranges[col] = _get_min_max(values=self._get_column_values(col))
+
+        return column_ranges[col]
+
+    def _get_column_ranges(self, columns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the minimum and maximum value of each numeric column. Larger DataFrames have their columns reduced in
+        parallel threads, which is possible as numpy releases the GIL whilst reducing numeric arrays.
+
+        Parameters
+        ----------
+        columns : list
+            Names of the numeric columns.
+
+        Returns
+        -------
+        tuple
+            Arrays containing the minimum and maximum value of each column.
+        """
+
+        max_workers = min(len(columns), os.cpu_count() or 1)
+
+        if max_workers > 1 and len(self._df) >= _PARALLEL_REDUCTION_MIN_ROWS:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                column_ranges = list(executor.map(self._get_column_range, columns))
+        else:
+            column_ranges = [self._get_column_range(col) for col in columns]
+
+        min_vals, max_vals = zip(*column_ranges)
+
+        return np.array(min_vals, dtype=np.float64), np.array(max_vals, dtype=np.float64)
+
+    def _get_column_values(self, col: str) -> np.ndarray:
+        """
+        Retrieve the numpy array holding a column's values. Arrays are cached so that the pandas overhead of selecting a
+        column is only incurred once, however many times its values are needed.
+
+        Parameters
+        ----------
+        col : str
+            Name of the column.
+
+        Returns
+        -------
+        numpy array
+            Values of the column.
+        """
+
+        column_values = self._column_cache['values']
+
+        if col not in column_values:
+            column_values[col] = self._df[col].to_numpy(copy=False)
+
+        return column_values[col]
+
     def get_possible_dtypes(self) -> Dict[str, type]:
         """
         Retrieve a dictionary containing any columns with the potential for reduced memory, and the dtype that can be
@@ -185,23 +921,49 @@ class DataFrameChecker:
 
         return self._all_possible_improvements
 
-    def identify_possible_improvements(self) -> None:
+    def identify_possible_improvements(
+            self, categorical_threshold: Optional[int] = None, reuse_column_statistics: bool = False
+    ) -> None:
         """
         Analyse the DataFrame and store a dictionary containing any column with the potential for reduced memory, and
         the dtype that can be used to represent it in a more efficient manner.
+
+        Parameters
+        ----------
+        categorical_threshold : int (optional)
+            The maximum number of distinct values in a column of strings to suggest transforming it into a categorical
+            column, replacing the one given when the checker was created.
+        reuse_column_statistics : bool (default False)
+            Reuse the ranges of numeric columns and the numbers of distinct strings found by the previous analysis, so
+            that the DataFrame can quickly be analysed again with a different categorical threshold. Only use this if
+            the DataFrame has not been edited since the previous analysis, otherwise the edits are not taken into
+            account.
         """
 
+        if categorical_threshold is not None:
+            self._categorical_threshold = categorical_threshold
+
+        # Start from the DataFrame as it is now, in case it has been edited since any previous analysis
+        if not reuse_column_statistics:
+            for cache in self._column_cache.values():
+                cache.clear()
+
+            self._columns_by_type = self._separate_dtypes()
+
         print('Checking float columns if reduced precision requested')
         float_improvements = self._flag_float_column_improvements()
-        self._all_possible_improvements.update(float_improvements)
 
         print('Checking integer columns to see whether a smaller size can be used')
         integer_improvements = self._check_if_integer_sizes_can_be_reduced()
-        self._all_possible_improvements.update(integer_improvements)
 
         print('Checking string columns to see if they be assigned to repeated categories')
         categorical_improvements = self._check_if_strings_could_be_categorical()
-        self._all_possible_improvements.update(categorical_improvements)
+
+        # Keep the improvements in the same order as the DataFrame's columns
+        all_improvements = {**float_improvements, **integer_improvements, **categorical_improvements}
+        self._all_possible_improvements = {
+            col: all_improvements[col] for col in self._df.columns if col in all_improvements
+        }
 
         self._dataframe_has_been_analysed = True
         print('Done')
@@ -217,12 +979,18 @@ class DataFrameChecker:
             Mapping between data type and the columns which correspond to that data type.
         """
 
+        # Mapping between the kind of a column's dtype and how it should be checked
+        dtype_kind_to_data_type = {'f': 'float', 'i': 'int', 'u': 'int', 'O': 'object'}
+
         columns_by_dtype = {}
 
-        for data_type in ['float', 'int', 'object']:
-            relevant_columns = list(self._df.select_dtypes(include=data_type).columns)
+        for col, dtype in self._df.dtypes.items():
+            data_type = dtype_kind_to_data_type.get(dtype.kind)
+
+            # Extension types which share a kind with the numpy types (e.g. nullable integers, categoricals) are skipped
+            if data_type is None or not (isinstance(dtype, np.dtype) or pd.api.types.is_string_dtype(dtype)):
+                continue
 
-            if relevant_columns:
-                columns_by_dtype[data_type] = relevant_columns
+            columns_by_dtype.setdefault(data_type, []).append(col)
 
         return columns_by_dtype
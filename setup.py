@@ -22,6 +22,7 @@ setuptools.setup(
     ],
     description='Evaluate pandas DataFrames to see whether their memory usage can be reduced without losing '
                 'information',
+    extras_require={'pyarrow': ['pyarrow']},
     install_requires=['pandas'],
     keywords=['data', 'science', 'pandas', 'memory', 'efficiency'],
     license='MIT',
@@ -7,7 +7,8 @@ import pytest
 import pandas_dtype_efficiency as pd_eff
 
 
-# Mock data for consistent evaluation
+# Mock data for consistent evaluation, with strings stored as Python objects (the default before pandas 3) in every
+# version of pandas
 MOCK_DF = pd.DataFrame(
     data={
         'floats': [-0.5, 0, 0, 0, 0, 0, 0, 0, 0, 0.5],
@@ -15,12 +16,15 @@ MOCK_DF = pd.DataFrame(
         'int_smaller_than_int16': [-32768, 0, 0, 0, 0, 0, 0, 0, 0, 32767],
         'int_smaller_than_int32': [-2147483648, 0, 0, 0, 0, 0, 0, 0, 0, 2147483647],
         'int_smaller_than_int64': [-9223372036854775808, 0, 0, 0, 0, 0, 0, 0, 0, 9223372036854775807],
-        'category_strings': ['C1', 'C2', 'C1', 'C2', 'C1', 'C2', 'C1', 'C2', 'C1', 'C2'],
-        'varied_strings': ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j'],
+        'category_strings': pd.Series(['C1', 'C2', 'C1', 'C2', 'C1', 'C2', 'C1', 'C2', 'C1', 'C2'], dtype=object),
+        'varied_strings': pd.Series(['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j'], dtype=object),
         'ineligible_column': [True, False, True, False, True, False, True, False, True, False]
     }
 )
 
+# Suggestion for the mock data's varied strings once they have too many distinct values to be categorical, which can
+# only be made if pyarrow is installed
+MOCK_DF_VARIED_STRINGS_IMPROVEMENT = {'varied_strings': 'string[pyarrow]'} if pd_eff._ARROW_STRINGS_AVAILABLE else {}
 
 # Mock data where no improvements can be made
 MOCK_DF_NO_IMPROVEMENTS = pd.DataFrame(data={'bool_1': [True, False], 'bool_2': [True, False]})
@@ -40,6 +44,55 @@ class TestDataFrameChecker:
     Tests for DataFrameChecker.
     """
 
+    @pytest.mark.parametrize(argnames='categorical_threshold', argvalues=[5, 15])
+    def test_analyse_parquet(self, tmp_path, categorical_threshold):
+        """
+        Parquet files are analysed batch by batch with the same results as analysing the DataFrame, and can be written
+        back out with the lower-memory data types applied.
+        """
+
+        pytest.importorskip('pyarrow')
+
+        input_path = tmp_path / 'mock.parquet'
+        output_path = tmp_path / 'mock_reduced_memory.parquet'
+        MOCK_DF.to_parquet(input_path, row_group_size=3)
+
+        checker = pd_eff.DataFrameChecker(df=MOCK_DF, categorical_threshold=categorical_threshold)
+        checker.identify_possible_improvements()
+
+        parquet_improvements = pd_eff.DataFrameChecker.analyse_parquet(
+            path=input_path, categorical_threshold=categorical_threshold, output_path=output_path
+        )
+
+        assert parquet_improvements == checker.get_possible_dtypes()
+
+        # Versions of pyarrow which cannot write half-precision floats write single-precision floats instead
+        expected_dtypes = checker.cast_dataframe_to_lower_memory_version().dtypes
+
+        if not pd_eff._ARROW_HALF_FLOATS_AVAILABLE:
+            expected_dtypes = expected_dtypes.replace({np.dtype('float16'): np.dtype('float32')})
+
+        # Arrow strings are written unchanged, so are read back in pandas' default data type for strings
+        arrow_string_columns = [col for col, dtype in parquet_improvements.items() if dtype == 'string[pyarrow]']
+
+        pd.testing.assert_series_equal(
+            left=pd.read_parquet(output_path).dtypes.drop(arrow_string_columns),
+            right=expected_dtypes.drop(arrow_string_columns)
+        )
+
+    def test_analyse_parquet_skips_index_columns(self, tmp_path):
+        """
+        Index columns written to a parquet file by pandas are not suggested improvements, as pandas reads them back in
+        as the index.
+        """
+
+        pytest.importorskip('pyarrow')
+
+        input_path = tmp_path / 'mock.parquet'
+        pd.DataFrame(data={'small_ints': [1, 2, 3]}, index=[10, 20, 30]).to_parquet(input_path)
+
+        assert pd_eff.DataFrameChecker.analyse_parquet(path=input_path) == {'small_ints': np.int8}
+
     def test_cast_dataframe_to_lower_memory_version(self, checker):
         """
         DataFrame has the appropriate columns converted to new data types.
@@ -64,17 +117,147 @@ class TestDataFrameChecker:
 
         pd.testing.assert_series_equal(left=lower_memory_df_dtypes, right=expected_output)
 
+    def test_cast_dataframe_to_lower_memory_version_prints_memory_in_megabytes(self, capsys):
+        """
+        The memory of the original and new DataFrames, including their index, is reported in megabytes.
+        """
+
+        df = pd.DataFrame(
+            data={
+                'small_ints': np.arange(100_000),
+                'category_strings': pd.Series(['C1', 'C2'] * 50_000, dtype=object)
+            }
+        )
+        df.index = np.arange(100_000) * 2
+
+        checker = pd_eff.DataFrameChecker(df=df)
+        checker.identify_possible_improvements()
+        capsys.readouterr()
+
+        lower_memory_df = checker.cast_dataframe_to_lower_memory_version()
+
+        assert capsys.readouterr().out.splitlines() == [
+            f'Original DataFrame memory: {df.memory_usage(deep=True).sum() / 1024 ** 2:,.2f} megabytes',
+            f'New DataFrame memory: {lower_memory_df.memory_usage(deep=True).sum() / 1024 ** 2:,.2f} megabytes'
+        ]
+
+    def test_cast_dataframe_to_lower_memory_version_preserves_other_columns(self):
+        """
+        Columns without possible improvements keep their data type, and values stay aligned with a non-unique index.
+        """
+
+        df = pd.DataFrame(
+            data={
+                'small_ints': [1, 2, 3],
+                'mixed_objects': pd.Series(['x', 1, 'z'], dtype=object)
+            }
+        )
+        df.index = [0, 0, 1]
+
+        checker = pd_eff.DataFrameChecker(df=df, categorical_threshold=2)
+        checker.identify_possible_improvements()
+
+        pd.testing.assert_frame_equal(
+            left=checker.cast_dataframe_to_lower_memory_version(),
+            right=df.astype(dtype={'small_ints': np.int8})
+        )
+
+    def test_cast_dataframe_to_lower_memory_version_wide_dataframe(self):
+        """
+        Few improvements in a wide DataFrame are cast without altering the original DataFrame.
+        """
+
+        df = pd.DataFrame(data={f'mixed_objects_{i}': pd.Series(['x', i, 'z'], dtype=object) for i in range(20)})
+        df['small_ints'] = [1, 2, 3]
+        original_df = df.copy()
+
+        checker = pd_eff.DataFrameChecker(df=df, categorical_threshold=2)
+        checker.identify_possible_improvements()
+
+        pd.testing.assert_frame_equal(
+            left=checker.cast_dataframe_to_lower_memory_version(),
+            right=df.astype(dtype={'small_ints': np.int8})
+        )
+        pd.testing.assert_frame_equal(left=df, right=original_df)
+
+    @pytest.mark.parametrize(argnames='num_bool_columns', argvalues=[1, 20])
+    def test_cast_dataframe_to_lower_memory_version_does_not_share_data(self, num_bool_columns):
+        """
+        Editing the new DataFrame does not alter the original DataFrame, including the columns which were not cast,
+        whether few or most of its columns are cast.
+        """
+
+        df = pd.DataFrame(data={f'bools_{i}': [True, False, True] for i in range(num_bool_columns)})
+        df['small_ints'] = [1, 2, 3]
+        original_df = df.copy()
+
+        checker = pd_eff.DataFrameChecker(df=df)
+        checker.identify_possible_improvements()
+
+        lower_memory_df = checker.cast_dataframe_to_lower_memory_version()
+        lower_memory_df.loc[0, 'bools_0'] = False
+
+        pd.testing.assert_frame_equal(left=df, right=original_df)
+
+    @pytest.mark.parametrize(argnames='replace_column', argvalues=[True, False])
+    def test_cast_dataframe_to_lower_memory_version_uses_edited_columns(self, replace_column):
+        """
+        Columns replaced or edited in place after the DataFrame has been analysed are cast from their new values rather
+        than the values which were analysed.
+        """
+
+        df = pd.DataFrame(
+            data={
+                'small_ints': [1, 2, 3, 4],
+                'category_strings': pd.Series(['x', 'y', 'x', 'y'], dtype=object)
+            }
+        )
+
+        checker = pd_eff.DataFrameChecker(df=df, categorical_threshold=3)
+        checker.identify_possible_improvements()
+
+        if replace_column:
+            df['small_ints'] = [4, 3, 2, 1]
+            df['category_strings'] = pd.Series(['z', 'y', 'x', 'y'], dtype=object)
+        else:
+            df.loc[0, 'small_ints'] = 4
+            df.loc[0, 'category_strings'] = 'z'
+
+        pd.testing.assert_frame_equal(
+            left=checker.cast_dataframe_to_lower_memory_version(),
+            right=df.astype(dtype={'small_ints': np.int8, 'category_strings': 'category'})
+        )
+
+    def test_cast_dataframe_to_lower_memory_version_reuses_categoricals(self):
+        """
+        Categoricals built whilst analysing the DataFrame are reused when requested, so an edit made after the analysis
+        is not picked up.
+        """
+
+        df = pd.DataFrame(data={'category_strings': pd.Series(['x', 'y', 'x', 'y'], dtype=object)})
+        analysed_df = df.copy()
+
+        checker = pd_eff.DataFrameChecker(df=df, categorical_threshold=3)
+        checker.identify_possible_improvements()
+
+        df.loc[0, 'category_strings'] = 'z'
+
+        pd.testing.assert_frame_equal(
+            left=checker.cast_dataframe_to_lower_memory_version(reuse_categoricals=True),
+            right=analysed_df.astype('category')
+        )
+
     def test_cast_dataframe_to_lower_memory_version_should_be_analysed_first(self, checker):
         """
         Warning is given if user tries to cast the DataFrame without having first evaluated it.
         """
 
-        with pytest.raises(
-                expected_exception=UserWarning,
+        with pytest.warns(
+                expected_warning=UserWarning,
                 match='DataFrame has not been analysed for improvements yet. Run `identify_possible_improvements` '
                       'method first.*'
         ):
-            checker.cast_dataframe_to_lower_memory_version()
+            assert checker.cast_dataframe_to_lower_memory_version() is None
 
     def test_cast_dataframe_to_lower_memory_version_warns_if_no_improvements(self):
         """
@@ -84,11 +267,11 @@ class TestDataFrameChecker:
         checker = pd_eff.DataFrameChecker(df=MOCK_DF_NO_IMPROVEMENTS)
         checker.identify_possible_improvements()
 
-        with pytest.raises(
-                expected_exception=UserWarning,
+        with pytest.warns(
+                expected_warning=UserWarning,
                 match='No possible improvements have been found after analysing DataFrame.*'
         ):
-            checker.cast_dataframe_to_lower_memory_version()
+            assert checker.cast_dataframe_to_lower_memory_version() is None
 
     def test__check_if_integer_sizes_can_be_reduced(self, checker):
         """
@@ -103,10 +286,27 @@ class TestDataFrameChecker:
 
         assert checker._check_if_integer_sizes_can_be_reduced() == expected_output
 
+    def test__check_if_integer_sizes_can_be_reduced_only_suggests_smaller_types(self):
+        """
+        Integer columns are not mapped to a type which is the same size or larger than their current one.
+        """
+
+        df = pd.DataFrame(
+            data={
+                'int8': np.array([0, 1], dtype=np.int8),
+                'uint8': np.array([0, 255], dtype=np.uint8),
+                'uint32': np.array([0, 255], dtype=np.uint32)
+            }
+        )
+
+        checker = pd_eff.DataFrameChecker(df=df)
+
+        assert checker._check_if_integer_sizes_can_be_reduced() == {'uint32': np.int16}
+
     @pytest.mark.parametrize(
         argnames='categorical_threshold, expected_output',
         argvalues=[
-            (5, {'category_strings': 'category'}),
+            (5, {'category_strings': 'category', **MOCK_DF_VARIED_STRINGS_IMPROVEMENT}),
             (15, {'category_strings': 'category', 'varied_strings': 'category'})
         ]
     )
@@ -120,6 +320,87 @@ class TestDataFrameChecker:
 
         assert checker._check_if_strings_could_be_categorical() == expected_output
 
+    def test__check_if_strings_could_be_categorical_prebuilds_categoricals(self, checker):
+        """
+        Columns which could be categorical are factorised whilst being checked, matching the result of casting them
+        with pandas.
+        """
+
+        checker._check_if_strings_could_be_categorical()
+
+        for col in ['category_strings', 'varied_strings']:
+            pd.testing.assert_series_equal(
+                left=pd.Series(checker._column_cache['categoricals'][col], name=col),
+                right=MOCK_DF[col].astype('category')
+            )
+
+    def test__check_if_strings_could_be_categorical_suggests_arrow_strings(self):
+        """
+        Columns of Python strings with too many distinct values to be categorical are represented as Arrow strings
+        instead, provided every value is a string.
+        """
+
+        pytest.importorskip('pyarrow')
+
+        df = pd.DataFrame(
+            data={
+                'category_strings': pd.Series(['C1', 'C2', 'C1', None], dtype=object),
+                'varied_strings': pd.Series(['a', 'b', 'c', None], dtype=object),
+                'mixed_objects': pd.Series(['a', 1, 'c', None], dtype=object)
+            }
+        )
+
+        checker = pd_eff.DataFrameChecker(df=df, categorical_threshold=2)
+
+        assert checker._check_if_strings_could_be_categorical() == {
+            'category_strings': 'category',
+            'varied_strings': 'string[pyarrow]'
+        }
+
+    @pytest.mark.parametrize(argnames='string_dtype', argvalues=[object, 'string[pyarrow]'])
+    def test__sample_could_be_categorical(self, string_dtype):
+        """
+        Sampled rows are spread throughout each string column, so a column whose distinct values only appear towards
+        its end is still ruled out. Arrow-backed string columns are checked in the same way as Python strings.
+        """
+
+        if string_dtype != object:
+            pytest.importorskip('pyarrow')
+
+        df = pd.DataFrame(
+            data={
+                'grouped_categories': ['C1'] * 500 + ['C2'] * 500,
+                'varied_strings_at_end': ['C1'] * 900 + [f'varied_{i}' for i in range(100)]
+            },
+            dtype=string_dtype
+        )
+
+        checker = pd_eff.DataFrameChecker(df=df, categorical_threshold=2)
+
+        assert checker._sample_could_be_categorical(col='grouped_categories', sample_size=200)
+        assert not checker._sample_could_be_categorical(col='varied_strings_at_end', sample_size=200)
+
+    @pytest.mark.parametrize(argnames='num_rows', argvalues=[1001, 1999, 2000, 2999])
+    def test__sample_could_be_categorical_reads_no_more_than_sample(self, monkeypatch, num_rows):
+        """
+        No more rows than the sample size are read, including from columns less than twice as long as the sample.
+        """
+
+        sampled_lengths = []
+        is_low_cardinality = pd_eff._is_low_cardinality
+
+        def _recording_is_low_cardinality(values, max_distinct_values):
+            sampled_lengths.append(len(values))
+            return is_low_cardinality(values=values, max_distinct_values=max_distinct_values)
+
+        monkeypatch.setattr(pd_eff, '_is_low_cardinality', _recording_is_low_cardinality)
+
+        df = pd.DataFrame(data={'category_strings': pd.Series(['C1', 'C2'] * num_rows, dtype=object)[:num_rows]})
+        checker = pd_eff.DataFrameChecker(df=df, categorical_threshold=2)
+
+        assert checker._sample_could_be_categorical(col='category_strings', sample_size=1000)
+        assert 500 <= sampled_lengths[0] <= 1000
+
     @pytest.mark.parametrize(
         argnames=('float_size', 'expected_output'),
         argvalues=[(16, {'floats': np.float16}), (32, {'floats': np.float32}), (64, {})]
@@ -135,9 +416,54 @@ class TestDataFrameChecker:
 
         assert checker._flag_float_column_improvements() == expected_output
 
+    def test__flag_float_column_improvements_avoids_overflow(self):
+        """
+        Float columns whose values would overflow the desired precision are moved up to the next float type which can
+        accommodate them, or ignored if none can.
+        """
+
+        df = pd.DataFrame(
+            data={
+                'small_floats': [-0.5, np.nan, 0.5],
+                'medium_floats': [-70000.0, 0.0, 70000.0],
+                'large_floats': [-1e300, 0.0, 1e300]
+            }
+        )
+
+        checker = pd_eff.DataFrameChecker(df=df, float_size=16)
+
+        assert checker._flag_float_column_improvements() == {'small_floats': np.float16, 'medium_floats': np.float32}
+
+    def test__get_column_ranges_in_parallel(self, monkeypatch):
+        """
+        Reducing the numeric columns in parallel threads finds the same ranges as reducing them one after another.
+        """
+
+        columns = ['floats', 'int_smaller_than_int8', 'int_smaller_than_int32', 'int_smaller_than_int64']
+
+        serial_min_vals, serial_max_vals = pd_eff.DataFrameChecker(df=MOCK_DF)._get_column_ranges(columns=columns)
+
+        # Force the mock data to use several threads, even on a machine with a single CPU
+        monkeypatch.setattr(pd_eff, '_PARALLEL_REDUCTION_MIN_ROWS', 1)
+        monkeypatch.setattr(pd_eff.os, 'cpu_count', lambda: 4)
+        thread_pool_sizes = []
+
+        class _RecordingThreadPoolExecutor(pd_eff.ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                thread_pool_sizes.append(max_workers)
+                super().__init__(max_workers=max_workers)
+
+        monkeypatch.setattr(pd_eff, 'ThreadPoolExecutor', _RecordingThreadPoolExecutor)
+
+        parallel_min_vals, parallel_max_vals = pd_eff.DataFrameChecker(df=MOCK_DF)._get_column_ranges(columns=columns)
+
+        assert thread_pool_sizes == [4]
+        np.testing.assert_array_equal(parallel_min_vals, serial_min_vals)
+        np.testing.assert_array_equal(parallel_max_vals, serial_max_vals)
+
     def test_get_potential_dtypes(self, checker):
         """
-        All possible improvements are compiled into a single dictionary.
+        All possible improvements are compiled into a single dictionary, following the order of the DataFrame's columns.
         """
 
         checker.identify_possible_improvements()
@@ -152,6 +478,60 @@ class TestDataFrameChecker:
         }
 
         assert checker.get_possible_dtypes() == expected_output
+        assert list(checker.get_possible_dtypes()) == list(expected_output)
+
+    def test_identify_possible_improvements_picks_up_edits(self):
+        """
+        Analysing the DataFrame again after editing it in place takes the edited values into account.
+        """
+
+        df = pd.DataFrame(data={'ints': np.arange(10), 'strings': pd.Series(['x', 'y'] * 5, dtype=object)})
+
+        checker = pd_eff.DataFrameChecker(df=df, categorical_threshold=2)
+        checker.identify_possible_improvements()
+
+        df.loc[0, 'ints'] = 100000
+        df.loc[0, 'strings'] = 'new'
+        checker.identify_possible_improvements()
+
+        assert checker.get_possible_dtypes()['ints'] == np.int32
+        assert checker.get_possible_dtypes().get('strings') != 'category'
+
+        lower_memory_df = checker.cast_dataframe_to_lower_memory_version()
+        assert lower_memory_df.loc[0, 'ints'] == 100000
+        assert lower_memory_df.loc[0, 'strings'] == 'new'
+
+    def test_identify_possible_improvements_reuses_column_statistics(self, checker, monkeypatch):
+        """
+        Analysing the DataFrame again with a different categorical threshold can reuse the ranges of its numeric
+        columns, whilst a fresh analysis finds them again.
+        """
+
+        columns_reduced = []
+        get_min_max = pd_eff._get_min_max
+
+        def _counting_get_min_max(values):
+            columns_reduced.append(values)
+            return get_min_max(values)
+
+        monkeypatch.setattr(pd_eff, '_get_min_max', _counting_get_min_max)
+
+        checker.identify_possible_improvements()
+        assert len(columns_reduced) == 5
+        assert checker.get_possible_dtypes()['varied_strings'] == 'category'
+
+        checker.identify_possible_improvements(categorical_threshold=5, reuse_column_statistics=True)
+        assert len(columns_reduced) == 5
+        assert checker.get_possible_dtypes().get('varied_strings') == MOCK_DF_VARIED_STRINGS_IMPROVEMENT.get(
+            'varied_strings'
+        )
+        assert checker.get_possible_dtypes()['category_strings'] == 'category'
+
+        checker.identify_possible_improvements()
+        assert len(columns_reduced) == 10
+        assert checker.get_possible_dtypes().get('varied_strings') == MOCK_DF_VARIED_STRINGS_IMPROVEMENT.get(
+            'varied_strings'
+        )
 
     def test__init_expects_valid_float_size(self):
         """
@@ -181,3 +561,95 @@ class TestDataFrameChecker:
         }
 
         assert checker._separate_dtypes() == expected_output
+
+    def test__separate_dtypes_handles_unsigned_and_extension_types(self):
+        """
+        Unsigned integers are checked alongside signed integers, whilst extension types such as categoricals and
+        nullable integers are left alone.
+        """
+
+        df = pd.DataFrame(
+            data={
+                'unsigned_ints': np.array([0, 1], dtype=np.uint16),
+                'categories': pd.Categorical(['C1', 'C2']),
+                'nullable_ints': pd.array([1, None], dtype='Int64')
+            }
+        )
+
+        checker = pd_eff.DataFrameChecker(df=df)
+
+        assert checker._separate_dtypes() == {'int': ['unsigned_ints']}
+
+
+class TestHelpers:
+    """
+    Tests for the module-level helper functions.
+    """
+
+    @pytest.mark.parametrize(
+        argnames='values, max_distinct_values, expected_output',
+        argvalues=[
+            (np.array(['a', 'b', 'a', 'b'], dtype=object), 2, True),
+            (np.array(['a', 'b', 'c', 'a'], dtype=object), 2, False),
+            (np.array(['a', np.nan, None, 'b', np.nan], dtype=object), 2, True)
+        ]
+    )
+    def test__is_low_cardinality(self, values, max_distinct_values, expected_output):
+        """
+        Distinct values are counted up to the limit, ignoring missing values.
+        """
+
+        assert pd_eff._is_low_cardinality(values=values, max_distinct_values=max_distinct_values) == expected_output
+
+    @pytest.mark.parametrize(
+        argnames='values, expected_output',
+        argvalues=[
+            (np.array([3, -7, 5, 1, 9, 0, 2]), (-7, 9)),
+            (np.array([np.nan, np.nan, np.nan, 1.5, -2.5, np.nan, np.nan]), (-2.5, 1.5)),
+            (np.array([np.nan, np.nan]), (np.inf, -np.inf))
+        ]
+    )
+    def test__get_min_max(self, monkeypatch, values, expected_output):
+        """
+        The range of an array is found across chunks, ignoring missing values.
+        """
+
+        # Force the values to span several chunks, some of which only contain missing values
+        monkeypatch.setattr(pd_eff, '_REDUCTION_CHUNK_SIZE', 3)
+
+        assert pd_eff._get_min_max(values=values) == expected_output
+
+    def test__find_smaller_integer_types(self):
+        """
+        The smallest integer type is found for ranges either side of each type's bounds.
+        """
+
+        ranges = [(-128, 127), (-129, 0), (0, 128), (-5, -1), (-2147483648, 2147483647), (0, 2147483648)]
+
+        assert pd_eff._find_smaller_integer_types(
+            min_vals=np.array([min_val for min_val, _ in ranges], dtype=np.float64),
+            max_vals=np.array([max_val for _, max_val in ranges], dtype=np.float64),
+            itemsizes=[8] * len(ranges)
+        ) == [np.int8, np.int16, np.int16, np.int8, np.int32, None]
+
+    @pytest.mark.parametrize(
+        argnames='string_dtype',
+        argvalues=[
+            object,
+            pytest.param(
+                'string[pyarrow]',
+                marks=pytest.mark.skipif(not pd_eff._ARROW_STRINGS_AVAILABLE, reason='Arrow strings are not available')
+            )
+        ]
+    )
+    def test__estimate_memory_usage(self, string_dtype):
+        """
+        The memory usage of a long string column is estimated from a sample of its rows, staying close to the exact
+        memory usage reported by pandas.
+        """
+
+        column = pd.Series([f'value_{i}' for i in range(10 * pd_eff._MEMORY_SAMPLE_SIZE)], dtype=string_dtype)
+
+        assert pd_eff._estimate_memory_usage(column=column) == pytest.approx(
+            column.memory_usage(index=False, deep=True), rel=0.1
+        )